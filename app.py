@@ -4,15 +4,97 @@ from datetime import datetime
 from typing import Optional, List
 import sqlite3
 import json
+import threading
+import functools
+from itertools import groupby
+from operator import itemgetter
+import logging
+import os
+from pathlib import Path
 
 from src.spacex_tracker import SpaceXTracker
+from src.filtering import filter_launches
+
+logger = logging.getLogger(__name__)
+# Debug logging in UI callbacks is skipped entirely unless SPACEX_DEBUG is set
+DEBUG = bool(os.environ.get("SPACEX_DEBUG"))
+
+# Header image, served by Gradio straight from the images folder instead of
+# being copied into its temp cache for every session
+IMAGE_PATH = Path(__file__).parent / "images" / "image.jpg"
+gr.set_static_paths([str(IMAGE_PATH.parent)])
 
 class SpaceXGradioApp:
-    def __init__(self):
-        self.tracker = SpaceXTracker()
+    def __init__(self, db_path: Optional[str] = None):
+        # db_path overrides the tracker's default cache location
+        self.tracker = SpaceXTracker(db_path) if db_path else SpaceXTracker()
+
+        if str(self.tracker.db_path) == ":memory:":
+            # A second connect would open a separate, empty in-memory DB: read
+            # through the tracker's own connection, serialized by its lock
+            self._ro_conn = self.tracker.conn
+            self._ro_lock = self.tracker._lock
+        else:
+            # Long-lived read connection shared by the UI callbacks
+            self._ro_conn = sqlite3.connect(
+                self.tracker.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=64
+            )
+            self._ro_conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-20000;
+                PRAGMA mmap_size=268435456;
+            """)
+            # Gradio may run callbacks concurrently
+            self._ro_lock = threading.Lock()
+        # Guards the caches below: a fill runs entirely under it, so a refresh
+        # clearing them from another thread can't interleave with a fill
+        self._cache_lock = threading.RLock()
+        # Unfiltered launches table, cleared on refresh
+        self._all_launches_cache = None
+        # Dropdown choices (rockets, sites), cleared on refresh
+        self._filter_opts_cache = None
+        # Tracker statistics, fetched once per refresh
+        self._stats_cache = None
+        # Statistics summary markdown, cleared on refresh
+        self._summary_cache = None
+        # (rocket_df, site_df, freq_df, freq_df split per view) for the charts,
+        # one value so a concurrent clear can't leave half of it behind
+        self._charts_cache = None
+        # Recent filter results keyed by the filter values, cleared on refresh
+        self._filter_cache = functools.lru_cache(maxsize=32)(self._query_launches)
 
-        #Initialize data on start
-        self.tracker.fetch_launches()
+        #Initialize data on start: only block when nothing is cached yet,
+        # a stale cache keeps serving while the refresh runs in the background
+        self._refresh_thread = None
+        self._refresh_ok = None
+        if self.tracker.is_cache_empty():
+            self.tracker.fetch_launches()
+        elif self.tracker._should_refresh_cache("launches"):
+            self._refresh_thread = threading.Thread(target=self._background_refresh, daemon=True)
+            self._refresh_thread.start()
+
+    def _background_refresh(self):
+        self._refresh_ok = self.tracker.fetch_launches(force_refresh=True)
+        if self._refresh_ok:
+            self._clear_caches()
+
+    def _clear_caches(self):
+        """Drop results derived from the launches table."""
+        with self._cache_lock:
+            self._all_launches_cache = None
+            self._filter_opts_cache = None
+            self._stats_cache = None
+            self._summary_cache = None
+            self._charts_cache = None
+            self._filter_cache.cache_clear()
+
+    def is_refreshing(self) -> bool:
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
 
     def get_last_updated_text(self):
         ts = self.tracker.get_cache_last_updated("launches")
@@ -22,31 +104,11 @@ class SpaceXGradioApp:
             return "**Last Updated:** No cached data yet"
     
     def get_all_launches_df(self) -> pd.DataFrame:
-        """Get all launches as a pandas DataFrame """
-        conn = sqlite3.connect(self.tracker.db_path)
-        query = """
-            SELECT 
-                name,
-                date_utc,
-                CASE 
-                    WHEN success = 1 THEN 'Success'
-                    WHEN success = 0 THEN 'Failed'
-                    ELSE 'Pending'
-                END as status,
-                rocket_name,
-                launchpad_name,
-                details
-            FROM launches
-            ORDER BY date_unix DESC
-        """
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        # verification required as UTC already available
-        df['date_utc'] = pd.to_datetime(df['date_utc']).dt.strftime('%Y-%m-%d %H:%M UTC')
-        df.columns = ['Mission Name', 'Launch Date', 'Status', 'Rocket', 'Launch Site', 'Details']
-        
-        return df
+        """Get all launches as a pandas DataFrame (cached until next refresh)."""
+        with self._cache_lock:
+            if self._all_launches_cache is None:
+                self._all_launches_cache = self._query_launches(None, None, None, None, None)
+            return self._all_launches_cache
     
     def filter_launches(self, 
                        start_date: Optional[str],
@@ -54,172 +116,179 @@ class SpaceXGradioApp:
                        rocket: Optional[str],
                        status: Optional[str],
                        launch_site: Optional[str]) -> pd.DataFrame:
-        """Filter launches based on UI filters."""
-        conn = sqlite3.connect(self.tracker.db_path)
-        
-        # Stich query conditions together
-        conditions = []
-        params = []
-        
-        if start_date:
-            conditions.append("date_unix >= ?")
-            params.append(start_date)
-        
-        if end_date:
-            conditions.append("date_unix <= ?")
-            params.append(end_date)
-        
-        if rocket and rocket != "All":
-            conditions.append("rocket_name = ?")
-            params.append(rocket)
-        
-        if status and status != "All":
-            if status == "Success":
-                conditions.append("success = 1")
-            elif status == "Failed":
-                conditions.append("success = 0")
-            elif status == "Pending":
-                conditions.append("success IS NULL")
-        
-        if launch_site and launch_site != "All":
-            conditions.append("launchpad_name = ?")
-            params.append(launch_site)
-        
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-        
-        query = f"""
-            SELECT 
-                name,
-                date_utc,
-                CASE 
-                    WHEN success = 1 THEN 'Success'
-                    WHEN success = 0 THEN 'Failed'
-                    ELSE 'Pending'
-                END as status,
-                rocket_name,
-                launchpad_name,
-                details
-            FROM launches
-            WHERE {where_clause}
-            ORDER BY date_unix DESC
-        """
-        # print("DEBUG: Query template:")
-        # print(query)
-        # print("DEBUG: Parameters:", params)
-        df = pd.read_sql_query(query, conn, params=params)
-        conn.close()
-        
-        if df.empty:
-            return pd.DataFrame(columns=['Mission Name', 'Launch Date', 'Status', 'Rocket', 'Launch Site', 'Details'])
-        
-        # verify required as UTC already available
-        df['date_utc'] = pd.to_datetime(df['date_utc']).dt.strftime('%Y-%m-%d %H:%M UTC')
-        df.columns = ['Mission Name', 'Launch Date', 'Status', 'Rocket', 'Launch Site', 'Details']
-        
-        return df
+        """Filter launches based on UI filters (repeated filters served from cache)."""
+        with self._cache_lock:
+            return self._filter_cache(start_date, end_date, rocket, status, launch_site)
+    
+    def _query_launches(self, start_date, end_date, rocket, status, launch_site) -> pd.DataFrame:
+        with self._ro_lock:
+            return filter_launches(self._ro_conn, start_date, end_date, rocket, status, launch_site)
+    
+    def _read_df(self, query: str, params=()) -> pd.DataFrame:
+        """Run a read query and build the DataFrame straight from the fetched rows."""
+        with self._ro_lock:
+            cursor = self._ro_conn.execute(query, params)
+            rows = cursor.fetchall()
+
+        columns = [col[0] for col in cursor.description]
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=False)
+    
+    def get_launch_details(self, launch_id: str) -> Optional[dict]:
+        """Get the description of a single launch, loaded on row click."""
+        with self._ro_lock:
+            # Row is a C-level mapping keyed by the SELECT's own column names
+            cursor = self._ro_conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            row = cursor.execute(
+                "SELECT name, date_utc, details FROM launches WHERE id = ?",
+                (launch_id,)
+            ).fetchone()
+
+        return dict(row) if row else None
     
     def get_filter_options(self):
-        """Get unique values for filter dropdowns."""
-        conn = sqlite3.connect(self.tracker.db_path)
-        cursor = conn.cursor()
-        
-        # Get unique rockets from DB
-        cursor.execute("SELECT DISTINCT rocket_name FROM launches WHERE rocket_name IS NOT NULL ORDER BY rocket_name")
-        rockets = ["All"] + [row[0] for row in cursor.fetchall()]
-        
-        # Get unique launch sites from DB
-        cursor.execute("SELECT DISTINCT launchpad_name FROM launches WHERE launchpad_name IS NOT NULL ORDER BY launchpad_name")
-        sites = ["All"] + [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        
+        """Get unique values for filter dropdowns (cached until next refresh)."""
+        with self._cache_lock:
+            if self._filter_opts_cache is None:
+                self._filter_opts_cache = self._build_filter_options()
+            return self._filter_opts_cache
+    
+    def _build_filter_options(self):
+        # Get unique rockets and launch sites from DB in one round-trip, tagged by kind
+        with self._ro_lock:
+            rows = self._ro_conn.execute("""
+                SELECT 'rocket' AS k, name AS v FROM rockets
+                WHERE id IN (SELECT rocket_id FROM launches)
+                UNION ALL
+                SELECT 'site', name FROM launchpads
+                WHERE id IN (SELECT launchpad_id FROM launches)
+                ORDER BY k, v
+            """).fetchall()
+
+        values = {kind: [v for _, v in group] for kind, group in groupby(rows, key=itemgetter(0))}
+        rockets = ["All"] + values.get('rocket', [])
+        sites = ["All"] + values.get('site', [])
         return rockets, sites
     
+    def _stats(self):
+        with self._cache_lock:
+            if self._stats_cache is None:
+                self._stats_cache = self.tracker.get_launch_statistics()
+            return self._stats_cache
+    
     def get_statistics_summary(self) -> str:
-        """Get formatted statistics summary."""
-        stats = self.tracker.get_launch_statistics()
-        
-        summary = (
+        """Get formatted statistics summary (cached until next refresh)."""
+        with self._cache_lock:
+            if self._summary_cache is None:
+                self._summary_cache = self._build_summary(self._stats())
+            return self._summary_cache
+    
+    def _build_summary(self, stats) -> str:
+        header = (
             f"# SpaceX Launch Statistics\n\n"
             f"## Overall Performance\n\n"
-            f"- **Total Launches:** {stats['total']}\n"
-            f"- **Successful:** {stats['successful']} ({stats['success_rate']}%)\n"
-            f"- **Failed:** {stats['failed']}\n"
-            f"- **Pending/Unknown:** {stats['pending']}\n\n"
-            f"## Most Used Rockets\n\n"
-            f"{''.join(f"- **{rocket}:** {count} launches\n" for rocket, count in stats['by_rocket'])}"
+            f"- **Total Launches:** {stats.total}\n"
+            f"- **Successful:** {stats.successful} ({stats.success_rate}%)\n"
+            f"- **Failed:** {stats.failed}\n"
+            f"- **Pending/Unknown:** {stats.pending}\n\n"
+            f"## Most Used Rockets\n"
         )
-        
-        return summary
+        rocket_lines = [f"- **{rocket}:** {count} launches" for rocket, count in stats.by_rocket]
+        return "\n".join([header, *rocket_lines])
     
     def get_statistics_charts_data(self):
-        stats = self.tracker.get_launch_statistics()
-
-        # Rocket launches stats (success, failed, pending)
-        rocket_rows = []
-        for rocket, data in stats.get("by_rocket_success", {}).items():
-            rocket_rows.append({
-                "Rocket": rocket,
-                "Successful": data.get("successful", 0),
-                "Failed": data.get("failed", 0),
-                "Pending": data.get("pending", 0)
-            })
-
-        # Sort by total launches (successful + failed + pending)
-        if rocket_rows:
-            rocket_df = pd.DataFrame(rocket_rows)
-            rocket_df['Total'] = rocket_df['Successful'] + rocket_df['Failed'] + rocket_df['Pending']
-            rocket_df = rocket_df.sort_values("Total", ascending=False).head(10)
-            # Drop the Total column as it's not needed for plotting
-            rocket_df = rocket_df.drop(columns=['Total'])
-            
-            # Melt for stacked bar chart
-            rocket_df = rocket_df.melt(
-                id_vars=['Rocket'],
-                value_vars=['Successful', 'Failed', 'Pending'],
-                var_name='Status',
-                value_name='Count'
+        """Get chart DataFrames (cached until next refresh)."""
+        rocket_df, site_df, freq_df, _ = self._charts()
+        return rocket_df, site_df, freq_df
+    
+    def _charts(self):
+        with self._cache_lock:
+            if self._charts_cache is None:
+                self._charts_cache = self._build_charts()
+            return self._charts_cache
+    
+    def _build_charts(self):
+        # Rocket launches by status, already melted for the stacked bar chart,
+        # limited to the 10 rockets with the most launches
+        rocket_df = self._read_df("""
+            SELECT Rocket, Status, Count
+            FROM (
+                SELECT *, DENSE_RANK() OVER (ORDER BY Total DESC, Rocket) AS rank
+                FROM (
+                    SELECT
+                        rocket_name AS Rocket,
+                        CASE
+                            WHEN success = 1 THEN 'Successful'
+                            WHEN success = 0 THEN 'Failed'
+                            ELSE 'Pending'
+                        END AS Status,
+                        COUNT(*) AS Count,
+                        SUM(COUNT(*)) OVER (PARTITION BY rocket_name) AS Total
+                    FROM launches_named
+                    WHERE rocket_name IS NOT NULL
+                    GROUP BY rocket_name, success
+                )
             )
-        else:
-            rocket_df = pd.DataFrame(columns=["Rocket", "Status", "Count"])
-
-        # Launch sites stats
-        site_data = stats.get("by_launch_site", {})
-        if site_data:
-            site_df = pd.DataFrame([
-                {"Launch Site": k, "Total Launches": v}
-                for k, v in site_data.items()
-            ]).sort_values("Total Launches", ascending=False).head(10)
-        else:
-            site_df = pd.DataFrame(columns=["Launch Site", "Total Launches"])
-
-        #  Frequency data by month/year
-        yearly_data = stats.get("by_year", [])
-        monthly_data = stats.get("by_month", [])
+            WHERE rank <= 10
+            ORDER BY rank
+        """)
 
-        # Create separate dataframes with type identifier
-        yearly_df = pd.DataFrame(yearly_data, columns=["Period", "Frequency"])
-        yearly_df["Type"] = "Yearly"
+        # Launch site totals and yearly/monthly frequency in one pass
+        with self._ro_lock:
+            counts = self._ro_conn.execute("""
+                SELECT 'Site', p.name, COUNT(*)
+                FROM launches l
+                JOIN launchpads p ON l.launchpad_id = p.id
+                GROUP BY p.name
+                UNION ALL
+                SELECT 'Yearly', year, COUNT(*)
+                FROM launches
+                GROUP BY year
+                UNION ALL
+                SELECT 'Monthly', year_month, COUNT(*)
+                FROM launches
+                GROUP BY year_month
+            """).fetchall()
 
-        monthly_df = pd.DataFrame(monthly_data, columns=["Period", "Frequency"])
-        monthly_df["Type"] = "Monthly"
+        # Split into columns in one pass so pandas builds from arrays, not rows
+        sites, site_totals = [], []
+        periods, frequencies, types = [], [], []
+        for kind, label, count in counts:
+            if kind == "Site":
+                sites.append(label)
+                site_totals.append(count)
+            else:
+                periods.append(label)
+                frequencies.append(count)
+                types.append(kind)
 
-        # Concatenate both dfs
-        if not yearly_df.empty or not monthly_df.empty:
-            freq_df = pd.concat([yearly_df, monthly_df], ignore_index=True)
-        else:
-            freq_df = pd.DataFrame(columns=["Period", "Frequency", "Type"])
+        # Launch sites stats
+        site_df = pd.DataFrame(
+            {"Launch Site": sites, "Total Launches": site_totals}
+        ).sort_values("Total Launches", ascending=False).head(10)
 
-        # Sort by period for consistent display
-        freq_df = freq_df.sort_values("Period").reset_index(drop=True)
+        #  Frequency data by month/year, built as one frame; stable sort by period
+        #  keeps a deterministic order for consistent display
+        freq_df = pd.DataFrame(
+            {"Period": periods, "Frequency": frequencies, "Type": types}
+        ).sort_values("Period", kind="mergesort")
         # # Export frequency dataframe to CSV
         # freq_df.to_csv('frequency_data.csv', index=False)
-        return rocket_df, site_df, freq_df
+        freq_views = {
+            view: freq_df[freq_df["Type"] == view].drop(columns=["Type"])
+            for view in ("Yearly", "Monthly")
+        }
+        return rocket_df, site_df, freq_df, freq_views
+    
+    def get_frequency_view(self, view: str) -> pd.DataFrame:
+        """Get launch frequency for the "Yearly" or "Monthly" view."""
+        return self._charts()[3][view]
     
     def refresh_data(self) -> str:
         """Fetch recent data from API."""
         success = self.tracker.fetch_launches(force_refresh=True)
         if success:
+            self._clear_caches()
             return "✓ Data refreshed successfully!"
         else:
             return "⚠ Refresh failed, using cached data"
@@ -230,10 +299,16 @@ def create_app():
     app = SpaceXGradioApp()
     rockets, sites = app.get_filter_options()
     
+    def table_value(df):
+        """Launch table as displayed (no raw id column) and the row ids for row clicks."""
+        return df.drop(columns="Launch ID"), df["Launch ID"].tolist()
+    
+    all_launches, all_ids = table_value(app.get_all_launches_df())
+    
     with gr.Blocks(title="SpaceX Launch Tracker", theme=gr.themes.Soft()) as demo:
         with gr.Row():
             gr.Image(
-                r"images\image.jpg",
+                str(IMAGE_PATH),
                 show_label=False,
                 show_download_button=False
             )
@@ -243,7 +318,9 @@ def create_app():
             gr.Markdown("")  # Spacer
             with gr.Column(scale=0, min_width=200):
                 refresh_btn_global = gr.Button("🔄 Fetch Data", size="sm", variant="secondary")
-                refresh_status_global = gr.Markdown()
+                refresh_status_global = gr.Markdown(
+                    value="⏳ Refreshing data in background..." if app.is_refreshing() else ""
+                )
     
         with gr.Tabs():
             # Tab 1: Launch Tracking
@@ -285,22 +362,23 @@ def create_app():
                     
                     with gr.Column(scale=3):
                         launches_table = gr.Dataframe(
-                            value=app.get_all_launches_df(),
+                            value=all_launches,
                             label="Launch Data",
                             wrap=True,
                             interactive=False,
                             column_widths=[
-                                120,   # launch_id
                                 180,   # mission_name
                                 140,   # launch_date
+                                120,   # status
                                 160,   # rocket
-                                220,   # launch_site
-                                300,   # description
-                                120    # status
+                                220    # launch_site
                             ]
                         )
                         
                         result_count = gr.Markdown()
+                        launch_details = gr.Markdown()
+                        # ids of the rows currently shown, in table order
+                        launch_ids = gr.State(all_ids)
                 
                 # Filter button on click action
                 def apply_filters(start, end, rocket, status, site):
@@ -311,27 +389,40 @@ def create_app():
                     if end is not None:
                         end = int(end)
 
-                    # print("DEBUG start unix:", start, type(start))
-                    # print("DEBUG end unix:", end, type(end))
+                    if DEBUG:
+                        logger.debug("Filter range unix: start=%r end=%r", start, end)
 
-                    df = app.filter_launches(start, end, rocket, status, site)
+                    df, ids = table_value(app.filter_launches(start, end, rocket, status, site))
                     count_msg = f"**Showing {len(df)} launches**"
-                    return df, count_msg
+                    return df, ids, count_msg
                 
                 filter_btn.click(
                     fn=apply_filters,
                     inputs=[start_date, end_date, rocket_filter, status_filter, launch_site_filter],
-                    outputs=[launches_table, result_count]
+                    outputs=[launches_table, launch_ids, result_count]
+                )
+                
+                # Row click loads the mission description on demand
+                def show_launch_details(ids, evt: gr.SelectData):
+                    launch = app.get_launch_details(ids[evt.index[0]])
+                    if not launch:
+                        return ""
+                    return f"#### {launch['name']}\n\n{launch['details'] or 'No details available.'}"
+                
+                launches_table.select(
+                    fn=show_launch_details,
+                    inputs=launch_ids,
+                    outputs=launch_details
                 )
                 
                 # Clear button on click action
                 def clear_filters():
-                    df = app.get_all_launches_df()
-                    return "", "", "All", "All", "All", df, f"**Showing {len(df)} launches**"
+                    df, ids = table_value(app.get_all_launches_df())
+                    return "", "", "All", "All", "All", df, ids, f"**Showing {len(df)} launches**"
                 
                 clear_btn.click(
                     fn=clear_filters,
-                    outputs=[start_date, end_date, rocket_filter, status_filter, launch_site_filter, launches_table, result_count]
+                    outputs=[start_date, end_date, rocket_filter, status_filter, launch_site_filter, launches_table, launch_ids, result_count]
                 )
             
             # 2nd Tab: Statistics
@@ -340,11 +431,12 @@ def create_app():
                 # refresh_status = gr.Markdown()
                 
                 stats_summary = gr.Markdown(value=app.get_statistics_summary())
+                rocket_df0, site_df0, _ = app.get_statistics_charts_data()
                 
                 with gr.Row():
                     with gr.Column():
                         rocket_success_chart = gr.BarPlot(
-                            value=app.get_statistics_charts_data()[0],
+                            value=rocket_df0,
                             x="Rocket",
                             y="Count",
                             color="Status",  # ( Stacked by status)
@@ -355,7 +447,7 @@ def create_app():
                         )
 
                         site_chart = gr.BarPlot(
-                            value=app.get_statistics_charts_data()[1],
+                            value=site_df0,
                             x="Launch Site",
                             y="Total Launches",
                             title="Total Launches by Site",
@@ -371,13 +463,10 @@ def create_app():
                     )
 
                 def update_frequency_chart(view):
-                    _, _, freq_df = app.get_statistics_charts_data()
-                    # print("DEBUG: Updating frequency df for view:", view)
-                    # print("DEBUG: Full df:\n", freq_df)
-                    filtered_df = freq_df[freq_df["Type"] == view]
-                    # print("DEBUG: Filtered df:\n", filtered_df)
-                    filtered_df = filtered_df.drop(columns=["Type"])
-                    return filtered_df
+                    # Precomputed per view, a toggle is just a lookup
+                    if DEBUG:
+                        logger.debug("Updating frequency chart for view: %s", view)
+                    return app.get_frequency_view(view)
 
                 with gr.Row():
                     frequency_chart = gr.BarPlot(
@@ -396,6 +485,52 @@ def create_app():
                     )
         last_updated_md = gr.Markdown(value=app.get_last_updated_text())
 
+        # Poll the startup background refresh until it finishes
+        refresh_timer = gr.Timer(2, active=app.is_refreshing())
+
+        def poll_background_refresh(start, end, rocket, status, site, view):
+            # Outputs past the timer are the data views, only redrawn once new data landed
+            unchanged = [gr.update()] * 9
+            if app.is_refreshing():
+                return gr.update(), gr.update(), gr.Timer(active=True), *unchanged
+            if not app._refresh_ok:
+                return ("⚠ Refresh failed, using cached data", app.get_last_updated_text(),
+                        gr.Timer(active=False), *unchanged)
+            
+            rockets, sites = app.get_filter_options()
+            rocket_df, site_df, _ = app.get_statistics_charts_data()
+            return (
+                "✓ Data refreshed successfully!",
+                app.get_last_updated_text(),
+                gr.Timer(active=False),
+                *apply_filters(start, end, rocket, status, site),
+                gr.update(choices=rockets),
+                gr.update(choices=sites),
+                app.get_statistics_summary(),
+                rocket_df,
+                site_df,
+                app.get_frequency_view(view)
+            )
+
+        refresh_timer.tick(
+            fn=poll_background_refresh,
+            inputs=[start_date, end_date, rocket_filter, status_filter, launch_site_filter, frequency_toggle],
+            outputs=[
+                refresh_status_global,
+                last_updated_md,
+                refresh_timer,
+                launches_table,
+                launch_ids,
+                result_count,
+                rocket_filter,
+                launch_site_filter,
+                stats_summary,
+                rocket_success_chart,
+                site_chart,
+                frequency_chart
+            ]
+        )
+
 
 
         gr.Markdown("""
@@ -405,16 +540,18 @@ def create_app():
         """)
 
         # Refresh button functionality common for both tabs
-        def refresh_all():
+        def refresh_all(view):
             status = app.refresh_data()
             summary = app.get_statistics_summary()
-            rocket_df, site_df, freq_df = app.get_statistics_charts_data()
+            rocket_df, site_df, _ = app.get_statistics_charts_data()
+            freq_df = app.get_frequency_view(view)
             last_updated = app.get_last_updated_text()
 
             return status, summary, freq_df, site_df, rocket_df, last_updated
         
         refresh_btn_global.click(
             fn=refresh_all,
+            inputs=frequency_toggle,
             outputs=[
                 refresh_status_global,
                 stats_summary,
@@ -429,5 +566,6 @@ def create_app():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if DEBUG else logging.INFO)
     demo = create_app()
     demo.launch(share=False, server_port=7860)
\ No newline at end of file
@@ -0,0 +1,98 @@
+import functools
+import logging
+import sqlite3
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality launch table columns, stored as pandas categoricals
+CATEGORY_COLUMNS = ('Status', 'Rocket', 'Launch Site')
+
+# Launch table columns as shown in the UI; dates are formatted and columns
+# named by SQLite, no pandas post-processing
+LAUNCH_COLUMNS_SQL = """
+    SELECT
+        id AS "Launch ID",
+        name AS "Mission Name",
+        strftime('%Y-%m-%d %H:%M UTC', date_utc) AS "Launch Date",
+        CASE
+            WHEN success = 1 THEN 'Success'
+            WHEN success = 0 THEN 'Failed'
+            ELSE 'Pending'
+        END AS "Status",
+        rocket_name AS "Rocket",
+        launchpad_name AS "Launch Site"
+    FROM launches_named
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_sql(conditions: Tuple[str, ...]) -> str:
+    # Same set of active filters -> same SQL string, only params differ,
+    # so sqlite3's statement cache gets hits
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return f"{LAUNCH_COLUMNS_SQL} WHERE {where_clause} ORDER BY date_unix DESC"
+
+
+def build_filter_query(start_date: Optional[str],
+                       end_date: Optional[str],
+                       rocket: Optional[str],
+                       status: Optional[str],
+                       launch_site: Optional[str]) -> Tuple[str, List]:
+    """Build the launch table query for the UI filters.
+
+    Returns:
+        (SQL, params) pair; "All" or empty values leave a filter out
+    """
+    # Stich query conditions together
+    conditions = []
+    params = []
+
+    if start_date:
+        conditions.append("date_unix >= ?")
+        params.append(start_date)
+
+    if end_date:
+        conditions.append("date_unix <= ?")
+        params.append(end_date)
+
+    # Names are resolved to ids so the filter runs on the indexed id columns
+    if rocket and rocket != "All":
+        conditions.append("rocket_id IN (SELECT id FROM rockets WHERE name = ?)")
+        params.append(rocket)
+
+    if status and status != "All":
+        if status == "Success":
+            conditions.append("success = 1")
+        elif status == "Failed":
+            conditions.append("success = 0")
+        elif status == "Pending":
+            conditions.append("success IS NULL")
+
+    if launch_site and launch_site != "All":
+        conditions.append("launchpad_id IN (SELECT id FROM launchpads WHERE name = ?)")
+        params.append(launch_site)
+
+    return _filter_sql(tuple(conditions)), params
+
+
+def filter_launches(conn: sqlite3.Connection,
+                    start_date: Optional[str],
+                    end_date: Optional[str],
+                    rocket: Optional[str],
+                    status: Optional[str],
+                    launch_site: Optional[str]) -> pd.DataFrame:
+    """Filter cached launches on the given connection, newest first."""
+    query, params = build_filter_query(start_date, end_date, rocket, status, launch_site)
+    # Logged right where it runs, so the log shows exactly the executed statement
+    logger.debug("Filter query: %s params: %s", query, params)
+    cursor = conn.execute(query, params)
+
+    columns = [col[0] for col in cursor.description]
+    df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=False)
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+
+    return df
@@ -1,10 +1,171 @@
-import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import orjson
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Optional
-import sys
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+# crew/payloads/failures/links are bound as-is and encoded to JSON text by the driver
+sqlite3.register_adapter(list, lambda value: orjson.dumps(value).decode())
+sqlite3.register_adapter(dict, lambda value: orjson.dumps(value).decode())
+
+# Bump when the cache tables change layout; older caches are dropped and refetched
+SCHEMA_VERSION = 3
+
+# Cache layout, created in one executescript round-trip
+SCHEMA_SQL = """
+BEGIN;
+
+-- table launches schema
+CREATE TABLE IF NOT EXISTS launches (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    date_utc TEXT NOT NULL,
+    date_unix INTEGER NOT NULL,
+    success INTEGER,
+    details TEXT,
+    rocket_id TEXT,
+    launchpad_id TEXT,
+    crew TEXT,
+    payloads TEXT,
+    failures TEXT,
+    links TEXT,
+    fetched_at TEXT NOT NULL,
+    year TEXT GENERATED ALWAYS AS (strftime('%Y', date_utc)) STORED,
+    year_month TEXT GENERATED ALWAYS AS (strftime('%Y-%m', date_utc)) STORED
+);
+
+-- rocket/launchpad names live once per id instead of on every launch row
+CREATE TABLE IF NOT EXISTS rockets (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS launchpads (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+
+-- launches with their rocket/launchpad names joined back in, for readers
+CREATE VIEW IF NOT EXISTS launches_named AS
+SELECT l.*, r.name AS rocket_name, p.name AS launchpad_name
+FROM launches l
+LEFT JOIN rockets r ON l.rocket_id = r.id
+LEFT JOIN launchpads p ON l.launchpad_id = p.id;
+
+-- matches the UI filters (rocket/site/status) and their date ordering
+CREATE INDEX IF NOT EXISTS idx_launches_filter
+ON launches(date_unix DESC, rocket_id, launchpad_id, success);
+
+-- GROUP BY columns of the statistics queries
+CREATE INDEX IF NOT EXISTS idx_launches_rocket ON launches(rocket_id);
+CREATE INDEX IF NOT EXISTS idx_launches_pad ON launches(launchpad_id);
+CREATE INDEX IF NOT EXISTS idx_launches_success ON launches(success);
+CREATE INDEX IF NOT EXISTS idx_launches_year ON launches(year);
+CREATE INDEX IF NOT EXISTS idx_launches_month ON launches(year_month);
+
+-- last update timestamp tracking
+CREATE TABLE IF NOT EXISTS cache_metadata (
+    key TEXT PRIMARY KEY,
+    last_updated INTEGER NOT NULL,
+    data TEXT
+);
+
+COMMIT;
+"""
+
+DROP_SCHEMA_SQL = """
+DROP VIEW IF EXISTS launches_named;
+DROP TABLE IF EXISTS launches;
+DROP TABLE IF EXISTS rockets;
+DROP TABLE IF EXISTS launchpads;
+DROP TABLE IF EXISTS cache_metadata;
+"""
+
+# Statistics queries, kept as constants so every refresh submits the same
+# text and the connection's statement cache reuses the prepared programs
+SQL_TOTAL = """
+    SELECT
+        COUNT(*) as total,
+        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+        SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
+        SUM(CASE WHEN success IS NULL THEN 1 ELSE 0 END) as pending
+    FROM launches
+"""
+
+SQL_BY_MONTH = """
+    SELECT year_month, COUNT(*) as count
+    FROM launches
+    GROUP BY year_month
+    ORDER BY year_month DESC
+"""
+
+SQL_BY_ROCKET_SUCCESS = """
+    SELECT
+        r.name,
+        SUM(CASE WHEN l.success = 1 THEN 1 ELSE 0 END) as successful,
+        SUM(CASE WHEN l.success = 0 THEN 1 ELSE 0 END) as failed,
+        SUM(CASE WHEN l.success IS NULL THEN 1 ELSE 0 END) as pending
+    FROM launches l
+    JOIN rockets r ON l.rocket_id = r.id
+    GROUP BY r.name
+"""
+
+SQL_BY_PAD = """
+    SELECT p.name, COUNT(*) as count
+    FROM launches l
+    JOIN launchpads p ON l.launchpad_id = p.id
+    GROUP BY p.name
+    ORDER BY count DESC
+"""
+
+
+@dataclass(slots=True)
+class RocketBreakdown:
+    """Launch outcomes for a single rocket."""
+    successful: int
+    failed: int
+    pending: int
+
+
+@dataclass(slots=True)
+class LaunchStats:
+    """Aggregated launch statistics."""
+    total: int
+    successful: int
+    failed: int
+    pending: int
+    success_rate: float
+    by_year: List[Tuple[str, int]]
+    by_month: List[Tuple[str, int]]
+    by_rocket: List[Tuple[str, int]]
+    by_rocket_success: Dict[str, RocketBreakdown]
+    by_launch_site: Dict[str, int]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LaunchStats":
+        """Rebuild statistics from their materialized JSON form."""
+        return cls(
+            total=data['total'],
+            successful=data['successful'],
+            failed=data['failed'],
+            pending=data['pending'],
+            success_rate=data['success_rate'],
+            by_year=[tuple(item) for item in data['by_year']],
+            by_month=[tuple(item) for item in data['by_month']],
+            by_rocket=[tuple(item) for item in data['by_rocket']],
+            by_rocket_success={
+                rocket: RocketBreakdown(**counts)
+                for rocket, counts in data['by_rocket_success'].items()
+            },
+            by_launch_site=data['by_launch_site']
+        )
+
 
 class SpaceXTracker:
     """Track and analyze SpaceX launches w/ local caching."""
@@ -16,64 +177,58 @@ class SpaceXTracker:
             db_path: Path to SQLite database (rework required for Docker)
         """
         self.api_base = "https://api.spacexdata.com/v4"
+        # Keep-alive session, built on the first fetch (see _session)
+        self._http = None
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the tracker's lifetime keeps SQLite's page cache warm;
+        # the lock serializes access from the UI and background refresh threads
+        self._conn = self._connect()
+        self._lock = threading.RLock()
         self._init_database()
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The tracker's long-lived DB connection (the only way to reach a :memory: cache)."""
+        return self._conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a DB connection with the tracker's PRAGMAs applied.
+        
+        WAL lets readers continue during the bulk insert, NORMAL sync drops
+        the extra fsync per commit, and temp/page cache stay in memory.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        # Only takes effect while the file is still empty (before the first table)
+        conn.execute("PRAGMA page_size=8192")
+        # WAL needs a real file, in-memory DBs keep their own journal
+        if str(self.db_path) != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=268435456;
+        """)
+        return conn
+    
     def _init_database(self):
         """Initialize SQLite DB with required tables."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # table launches schema
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS launches (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    date_utc TEXT NOT NULL,
-                    date_unix INTEGER NOT NULL,
-                    success INTEGER,
-                    details TEXT,
-                    rocket_id TEXT,
-                    rocket_name TEXT,
-                    launchpad_id TEXT,
-                    launchpad_name TEXT,
-                    crew TEXT,
-                    payloads TEXT,
-                    failures TEXT,
-                    links TEXT,
-                    fetched_at TEXT NOT NULL
-                )
-            """)
-            
-            # last update timestamp tracking
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cache_metadata (
-                    key TEXT PRIMARY KEY,
-                    last_updated TEXT NOT NULL,
-                    data TEXT
-                )
-            """)
-            
-            conn.commit()
-            print(f"Database initialized at: {self.db_path.absolute()}")
-            
-        except Exception as e:
-            print(f"Database initialization failed: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            if conn:
-                conn.close()
+        with self._lock:
+            # Cache tables only hold API data, so a layout change just rebuilds them
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.executescript(DROP_SCHEMA_SQL + f"PRAGMA user_version = {SCHEMA_VERSION};")
+            self._conn.executescript(SCHEMA_SQL)
+        
+        print(f"Database initialized at: {self.db_path.absolute()}")
                 
     def is_cache_empty(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM launches")
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count == 0
+        # EXISTS stops at the first row instead of counting the whole table
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM launches)")
+            has_rows = cursor.fetchone()[0]
+        return not has_rows
     
     def _should_refresh_cache(self, cache_key: str, max_age_hours: int = 24) -> bool:
         """Check if cache needs to be refreshed based on timestamp in cache_metadata     
@@ -84,52 +239,75 @@ class SpaceXTracker:
         Returns:
             If cache should be refreshed returns True, else False
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT last_updated FROM cache_metadata WHERE key = ?",
-            (cache_key,)
-        )
-        result = cursor.fetchone()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute(
+                "SELECT last_updated FROM cache_metadata WHERE key = ?",
+                (cache_key,)
+            )
+            result = cursor.fetchone()
         
         if not result:
             return True
         
-        last_updated = datetime.fromisoformat(result[0])
-        return datetime.now() - last_updated > timedelta(hours=max_age_hours)
+        # last_updated is unix seconds, a plain numeric comparison
+        return time.time() - result[0] > max_age_hours * 3600
     
     def _update_cache_metadata(self, cache_key: str, data: Optional[str] = None):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache_metadata (key, last_updated, data)
-            VALUES (?, ?, ?)
-        """, (cache_key, datetime.now().isoformat(), data))
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            cursor.execute("""
+                INSERT OR REPLACE INTO cache_metadata (key, last_updated, data)
+                VALUES (?, ?, ?)
+            """, (cache_key, int(time.time()), data))
+    
+    def _get_cache_data(self, cache_key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM cache_metadata WHERE key = ?",
+                (cache_key,)
+            ).fetchone()
+        return row[0] if row else None
     
     def get_cache_last_updated(self, cache_key: str = "launches") -> Optional[str]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
 
-        cursor.execute(
-            "SELECT last_updated FROM cache_metadata WHERE key = ?",
-            (cache_key,)
-        )
-        row = cursor.fetchone()
-        conn.close()
+            cursor.execute(
+                "SELECT last_updated FROM cache_metadata WHERE key = ?",
+                (cache_key,)
+            )
+            row = cursor.fetchone()
 
         if not row:
             return None
 
         # Format nicely for UI
-        dt = datetime.fromisoformat(row[0])
+        dt = datetime.fromtimestamp(row[0], tz=timezone.utc)
         return dt.strftime("%Y-%m-%d %H:%M UTC")
 
+    def _session(self) -> "requests.Session":
+        """Keep-alive session so refreshes reuse the TCP/TLS connection.
+        
+        requests is imported here rather than at module level, stats-only
+        runs served from the cache never pay for it.
+        """
+        with self._lock:
+            if self._http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._http = requests.Session()
+                self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+            return self._http
+    
+    def _http_get(self, endpoint: str, headers: Optional[Dict] = None) -> "requests.Response":
+        """GET an API endpoint over the shared session."""
+        response = self._session().get(f"{self.api_base}/{endpoint}", headers=headers, timeout=10)
+        response.raise_for_status()
+        return response
+
     def fetch_launches(self, force_refresh: bool = False) -> bool:
         """Fetch all launches from SpaceX API and cache locally.
         
@@ -143,56 +321,121 @@ class SpaceXTracker:
             print("Using cached data (fresh within 24 hours)")
             return True
         
+        import requests
+        
         try:
             print("Fetching launches from SpaceX API...")
-            response = requests.get(f"{self.api_base}/launches", timeout=10)
-            response.raise_for_status()
-            launches = response.json()
+            # launches, rockets and launchpads are independent, fetch them concurrently
+            endpoints = ("launches", "rockets", "launchpads")
+            # Conditional request for launches, upstream answers 304 if unchanged
+            headers = {name: None for name in endpoints}
+            etag = self._get_cache_data("launches_etag")
+            if etag and not self.is_cache_empty():
+                headers["launches"] = {"If-None-Match": etag}
+            
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+                futures = {name: pool.submit(self._http_get, name, headers[name]) for name in endpoints}
+                responses = {name: future.result() for name, future in futures.items()}
+            
+            if responses["launches"].status_code == 304:
+                self._update_cache_metadata("launches")
+                print("Launches unchanged upstream, cache marked fresh")
+                return True
+            
+            launches = orjson.loads(responses["launches"].content)
             
             # print("\n--- SAMPLE API RESPONSE (first 5 launches) ---")
             # for i, launch in enumerate(launches[:2], start=1):
             #     print(f"\nLaunch #{i}")
-            #     print(json.dumps(launch, indent=2))
+            #     print(orjson.dumps(launch, option=orjson.OPT_INDENT_2).decode())
             # print("\n--- END SAMPLE ---\n")
 
-            # Fetch rockets for names
-            rockets_response = requests.get(f"{self.api_base}/rockets", timeout=10)
-            rockets = {r['id']: r['name'] for r in rockets_response.json()}
-            
-            # Fetch launchpads for names
-            pads_response = requests.get(f"{self.api_base}/launchpads", timeout=10)
-            launchpads = {p['id']: p['name'] for p in pads_response.json()}
-            
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Rocket and launchpad names
+            rockets = {r['id']: r['name'] for r in orjson.loads(responses["rockets"].content)}
+            launchpads = {p['id']: p['name'] for p in orjson.loads(responses["launchpads"].content)}
             
+            # One fetch timestamp for the whole batch
+            fetched_at = datetime.now().isoformat()
+            rows = []
             for launch in launches:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO launches VALUES (
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                    )
-                """, (
+                success = launch.get('success')
+                rows.append((
                     launch['id'],
                     launch['name'],
                     launch['date_utc'],
                     launch['date_unix'],
-                    1 if launch.get('success') else 0 if launch.get('success') is False else None,
+                    None if success is None else int(success),
                     launch.get('details'),
                     launch.get('rocket'),
-                    rockets.get(launch.get('rocket')),
                     launch.get('launchpad'),
-                    launchpads.get(launch.get('launchpad')),
-                    json.dumps(launch.get('crew', [])),
-                    json.dumps(launch.get('payloads', [])),
-                    json.dumps(launch.get('failures', [])),
-                    json.dumps(launch.get('links', {})),
-                    datetime.now().isoformat()
+                    launch.get('crew', []),
+                    launch.get('payloads', []),
+                    launch.get('failures', []),
+                    launch.get('links', {}),
+                    fetched_at
                 ))
             
-            conn.commit()
-            conn.close()
+            # One prepared INSERT for every row; take the write lock up front and
+            # commit the whole batch at once
+            with self._lock:
+                # Hold off auto-checkpoints until the batch is in, then checkpoint once
+                self._conn.execute("PRAGMA wal_autocheckpoint=10000")
+                try:
+                    with self._conn:
+                        self._conn.execute("BEGIN IMMEDIATE")
+                        self._conn.executemany("""
+                            INSERT INTO rockets VALUES (?, ?)
+                            ON CONFLICT(id) DO UPDATE SET name = excluded.name
+                            WHERE name IS NOT excluded.name
+                        """, rockets.items())
+                        self._conn.executemany("""
+                            INSERT INTO launchpads VALUES (?, ?)
+                            ON CONFLICT(id) DO UPDATE SET name = excluded.name
+                            WHERE name IS NOT excluded.name
+                        """, launchpads.items())
+                        # Unchanged launches are left alone instead of being rewritten
+                        self._conn.executemany("""
+                            INSERT INTO launches (
+                                id, name, date_utc, date_unix, success, details,
+                                rocket_id, launchpad_id, crew, payloads, failures, links,
+                                fetched_at
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT(id) DO UPDATE SET
+                                name = excluded.name,
+                                date_utc = excluded.date_utc,
+                                date_unix = excluded.date_unix,
+                                success = excluded.success,
+                                details = excluded.details,
+                                rocket_id = excluded.rocket_id,
+                                launchpad_id = excluded.launchpad_id,
+                                crew = excluded.crew,
+                                payloads = excluded.payloads,
+                                failures = excluded.failures,
+                                links = excluded.links,
+                                fetched_at = excluded.fetched_at
+                            WHERE launches.name IS NOT excluded.name
+                                OR launches.date_utc IS NOT excluded.date_utc
+                                OR launches.date_unix IS NOT excluded.date_unix
+                                OR launches.success IS NOT excluded.success
+                                OR launches.details IS NOT excluded.details
+                                OR launches.rocket_id IS NOT excluded.rocket_id
+                                OR launches.launchpad_id IS NOT excluded.launchpad_id
+                                OR launches.crew IS NOT excluded.crew
+                                OR launches.payloads IS NOT excluded.payloads
+                                OR launches.failures IS NOT excluded.failures
+                                OR launches.links IS NOT excluded.links
+                        """, rows)
+                
+                    # refresh planner statistics so the filter index gets picked
+                    self._conn.execute("ANALYZE launches")
+                    self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                finally:
+                    self._conn.execute("PRAGMA wal_autocheckpoint=1000")
             
             self._update_cache_metadata("launches")
+            self._update_cache_metadata("launches_etag", responses["launches"].headers.get("ETag"))
+            # Materialize statistics once per ingest instead of per request
+            self._update_cache_metadata("stats", orjson.dumps(self._compute_launch_statistics()).decode())
             print(f"Successfully cached {len(launches)} launches")
             return True
             
@@ -204,119 +447,101 @@ class SpaceXTracker:
             print(f"Error: {e}")
             return False
     
-    def get_launch_statistics(self) -> Dict:
-        """Calculate launch statistics from DB cached data.
+    @property
+    def launch_count(self) -> int:
+        """Number of cached launches, served from the statistics materialized at ingest."""
+        return self.get_launch_statistics().total
+    
+    def get_launch_statistics(self) -> LaunchStats:
+        """Get launch statistics, precomputed at ingest time.
         
         Returns:
-            Dictionary with statistics on launch data
+            LaunchStats with statistics on launch data
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM cache_metadata WHERE key = 'stats'"
+            ).fetchone()
         
-        # Total launches
-        cursor.execute("SELECT COUNT(*) FROM launches")
-        total = cursor.fetchone()[0]
+        if row and row[0]:
+            return LaunchStats.from_dict(orjson.loads(row[0]))
         
-        # Success rate
-        cursor.execute("""
-            SELECT 
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN success IS NULL THEN 1 ELSE 0 END) as pending
-            FROM launches
-        """)
-        successful, failed, pending = cursor.fetchone()
-        
-        # Launches by year
-        cursor.execute("""
-            SELECT strftime('%Y', date_utc) as year, COUNT(*) as count
-            FROM launches
-            GROUP BY year
-            ORDER BY year DESC
-        """)
-        by_year = cursor.fetchall()
-        
-        # Launches by month
-        cursor.execute("""
-            SELECT strftime('%Y-%m', date_utc) as month, COUNT(*) as count
-            FROM launches
-            GROUP BY month
-            ORDER BY month DESC
-        """)
-        by_month = cursor.fetchall()
-        
-        # Most used rockets
-        cursor.execute("""
-            SELECT rocket_name, COUNT(*) as count
-            FROM launches
-            WHERE rocket_name IS NOT NULL
-            GROUP BY rocket_name
-            ORDER BY count DESC
-        """)
-        by_rocket = cursor.fetchall()
-        
-        # Rocket launches breakdown (include every statuses)
-        cursor.execute("""
-            SELECT 
-                rocket_name,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN success IS NULL THEN 1 ELSE 0 END) as pending
-            FROM launches
-            WHERE rocket_name IS NOT NULL
-            GROUP BY rocket_name
-        """)
-        rocket_success_data = cursor.fetchall()
+        # Not materialized yet (DB cached before stats were stored)
+        stats = self._compute_launch_statistics()
+        self._update_cache_metadata("stats", orjson.dumps(stats).decode())
+        return stats
+    
+    def _compute_launch_statistics(self) -> LaunchStats:
+        """Calculate launch statistics from DB cached data."""
+        with self._lock:
+            cursor = self._conn.cursor()
+
+            # Total launches and success breakdown in one pass
+            cursor.execute(SQL_TOTAL)
+            total, successful, failed, pending = cursor.fetchone()
+
+            # Launches by month (yearly counts are rolled up from these)
+            cursor.execute(SQL_BY_MONTH)
+            by_month = cursor.fetchall()
+
+            # Rocket launches breakdown (include every statuses)
+            cursor.execute(SQL_BY_ROCKET_SUCCESS)
+            rocket_success_data = cursor.fetchall()
+
+            # Launches by launch site
+            cursor.execute(SQL_BY_PAD)
+            by_launch_site = dict(cursor.fetchall())
+
+        # Launches by year, months are already in descending order
+        year_counts = {}
+        for month, count in by_month:
+            year_counts[month[:4]] = year_counts.get(month[:4], 0) + count
+        by_year = list(year_counts.items())
+
         by_rocket_success = {
-            rocket: {
-                'successful': successful,
-                'failed': failed,
-                'pending': pending
-            }
+            rocket: RocketBreakdown(successful, failed, pending)
             for rocket, successful, failed, pending in rocket_success_data
         }
+
+        # Most used rockets
+        by_rocket = sorted(
+            (
+                (rocket, counts.successful + counts.failed + counts.pending)
+                for rocket, counts in by_rocket_success.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True
+        )
         
-        # Launches by launch site
-        cursor.execute("""
-            SELECT launchpad_name, COUNT(*) as count
-            FROM launches
-            WHERE launchpad_name IS NOT NULL
-            GROUP BY launchpad_name
-            ORDER BY count DESC
-        """)
-        by_launch_site = dict(cursor.fetchall())
-        
-        conn.close()
-        
-        return {
-            'total': total,
-            'successful': successful or 0,
-            'failed': failed or 0,
-            'pending': pending or 0,
-            'success_rate': round((successful or 0) / total * 100, 2) if total > 0 else 0,
-            'by_year': by_year,
-            'by_month': by_month,
-            'by_rocket': by_rocket,
-            'by_rocket_success': by_rocket_success,
-            'by_launch_site': by_launch_site
-        }
+        return LaunchStats(
+            total=total,
+            successful=successful or 0,
+            failed=failed or 0,
+            pending=pending or 0,
+            success_rate=round((successful or 0) / total * 100, 2) if total > 0 else 0,
+            by_year=by_year,
+            by_month=by_month,
+            by_rocket=by_rocket,
+            by_rocket_success=by_rocket_success,
+            by_launch_site=by_launch_site
+        )
 
-def display_statistics(stats: Dict):
+def display_statistics(stats: LaunchStats):
     """Display formatted statistics."""
     print("\n" + "="*60)
     print("SPACEX LAUNCH STATISTICS")
     print("="*60)
-    print(f"\nTotal Launches: {stats['total']}")
-    print(f"Successful: {stats['successful']} ({stats['success_rate']}%)")
-    print(f"Failed: {stats['failed']}")
-    print(f"Pending/Unknown: {stats['pending']}")
+    print(f"\nTotal Launches: {stats.total}")
+    print(f"Successful: {stats.successful} ({stats.success_rate}%)")
+    print(f"Failed: {stats.failed}")
+    print(f"Pending/Unknown: {stats.pending}")
     
     print("\n--- Launches by Year ---")
-    for year, count in stats['by_year'][:5]:
+    for year, count in stats.by_year[:5]:
         print(f"  {year}: {count} launches")
     
     print("\n--- Most Used Rockets ---")
-    for rocket, count in stats['by_rocket'][:5]:
+    for rocket, count in stats.by_rocket[:5]:
         print(f"  {rocket}: {count} launches")
     print("="*60 + "\n")
 
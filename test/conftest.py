@@ -0,0 +1,68 @@
+import functools
+from pathlib import Path
+
+import orjson
+import pandas as pd
+import pytest
+
+from src.spacex_tracker import SpaceXTracker
+
+
+@functools.lru_cache(maxsize=1)
+def load_test_data():
+    """Load sample launch data for testing (parsed once per session)"""
+    data = orjson.loads(Path(__file__).with_name("test_data.json").read_bytes())
+    
+    # Expected success rate, pending launches have success=None and don't count
+    successes = pd.DataFrame(data["launches"])["success"].eq(True).sum()
+    data["_expected_success_rate"] = round(successes / len(data["launches"]) * 100, 2)
+    return data
+
+
+class FakeAPI:
+    """Simulates SpaceX API responses"""
+    __slots__ = ("data",)
+    status_code = 200
+    headers = {}
+
+    def __init__(self, data):
+        self.data = data
+    
+    def json(self):
+        return self.data
+
+    @property
+    def content(self):
+        return orjson.dumps(self.data)
+
+
+# endpoint name -> canned response, built once at import
+_RESPONSES = {
+    name: FakeAPI(load_test_data()[name])
+    for name in ("launches", "rockets", "launchpads")
+}
+
+
+def fake_api_call(tracker, endpoint, headers=None):
+    """Stands in for SpaceXTracker._http_get, returns synthetic data instead of calling real API"""
+    return _RESPONSES[endpoint]
+
+
+@pytest.fixture(scope="session")
+def test_data():
+    """Parsed test_data.json, shared by every test"""
+    return load_test_data()
+
+
+@pytest.fixture(scope="session")
+def api_responses():
+    """Canned responses served by the fake API, keyed by endpoint"""
+    return _RESPONSES
+
+
+@pytest.fixture(scope="session")
+def fake_http():
+    """Serve the tracker's HTTP layer from the test data, plain setattr and no Mock"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(SpaceXTracker, "_http_get", fake_api_call)
+        yield
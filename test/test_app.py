@@ -0,0 +1,95 @@
+import contextlib
+import copy
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from app import SpaceXGradioApp
+
+# tmpfs keeps file-backed test DBs in RAM where available
+TMPDIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+@contextlib.contextmanager
+def _tmp_db():
+    # The app opens its own read connection, so it needs a real file
+    fd, path = tempfile.mkstemp(suffix=".db", dir=TMPDIR)
+    os.close(fd)
+    try:
+        yield path
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            Path(path + suffix).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def tmp_db_path():
+    """Fresh file-backed DB for code that opens its own connections, removed afterwards"""
+    with _tmp_db() as path:
+        yield path
+
+
+@pytest.fixture(scope="session")
+def app(fake_http):
+    """App filled once from the test data and shared by the read-only tests"""
+    with _tmp_db() as path:
+        yield SpaceXGradioApp(path)
+
+
+# Test 1: Check filtering through the app, every case reads the one session ingest
+@pytest.mark.parametrize("rocket, status, site, expected_ids", [
+    ("Falcon 9", "All", "All", ["L2", "L1"]),
+    ("Falcon Heavy", "All", "All", ["L3"]),
+    ("All", "Failed", "All", ["L2"]),
+    ("All", "All", "VAFB", ["L3"]),
+])
+def test_filter_launches(app, rocket, status, site, expected_ids):
+    filtered = app.filter_launches(
+        start_date=None,
+        end_date=None,
+        rocket=rocket,
+        status=status,
+        launch_site=site
+    )
+
+    assert not filtered.empty
+    assert list(filtered["Launch ID"]) == expected_ids
+    if rocket != "All":
+        assert (filtered["Rocket"].to_numpy() == rocket).all()
+
+
+# Test 2: Check dropdown choices come from the rockets/launchpads tables
+def test_filter_options(app):
+    rockets, sites = app.get_filter_options()
+
+    assert rockets == ["All", "Falcon 9", "Falcon Heavy"]
+    assert sites == ["All", "KSC", "VAFB"]
+
+
+# Test 3: Check the per-view frequency tables
+def test_frequency_views(app, test_data):
+    yearly = app.get_frequency_view("Yearly")
+
+    assert list(yearly.columns) == ["Period", "Frequency"]
+    assert list(yearly["Period"]) == ["2020", "2021", "2022"]
+    assert yearly["Frequency"].sum() == len(test_data["launches"])
+
+
+# Test 4: Check a refresh rebuilds cached results instead of serving stale ones
+def test_refresh_rebuilds_caches(fake_http, tmp_db_path, api_responses, monkeypatch):
+    app = SpaceXGradioApp(tmp_db_path)
+    assert len(app.filter_launches(None, None, "All", "Failed", "All")) == 1
+    assert "**Failed:** 1" in app.get_statistics_summary()
+
+    # The pending launch comes back as failed on the next fetch
+    launches = copy.deepcopy(api_responses["launches"].data)
+    launches[-1]["success"] = False
+    monkeypatch.setattr(api_responses["launches"], "data", launches)
+
+    assert app.refresh_data().startswith("✓")
+    assert len(app.filter_launches(None, None, "All", "Failed", "All")) == 2
+    summary = app.get_statistics_summary()
+    assert "**Failed:** 2" in summary
+    assert "**Pending/Unknown:** 0" in summary